@@ -0,0 +1,74 @@
+"""Numeric kernels used by `~kanon.units.radices.BasedReal`.
+
+The kernels are JIT-compiled with `numba` when it is available,
+and run as plain Python functions otherwise.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+
+__all__ = ["from_float_loop", "carry_loop"]
+
+
+@njit(cache=True)
+def from_float_loop(
+    value: float, radices: np.ndarray, significant: int, remainder_threshold: float
+):
+    """
+    Digit extraction loop of `~kanon.units.radices.BasedReal.from_float`.
+
+    :param value: Absolute fractional value to decompose
+    :param radices: Radices of the `significant` first fractional positions
+    :param significant: Number of fractional positions
+    :param remainder_threshold: Threshold above which the remainder is rounded up
+    :return: Fractional digits as an int64 array, and the remainder
+    """
+
+    right = np.zeros(significant, dtype=np.int64)
+
+    if value != 0:
+        nonzero = False
+        for i in range(significant):
+            factor = radices[i]
+            value *= factor
+            if value - int(value) > remainder_threshold and value + 1 < factor:
+                value = float(int(value) + 1)
+            elif value - int(value) < 1 - remainder_threshold and nonzero:
+                value = float(int(value))
+            position_value = int(value)
+            value -= position_value
+            right[i] = position_value
+            if position_value != 0:
+                nonzero = True
+
+    return right, value
+
+
+@njit(cache=True)
+def carry_loop(numbers: np.ndarray, radices: np.ndarray):
+    """
+    Carry-normalization pass of `~kanon.units.radices.BasedReal._add`.
+
+    Digits are ordered from the least significant position upwards and
+    bounded by the matching entry of `radices`; out-of-range digits are
+    reduced in place, propagating a carry of +-1.
+
+    :param numbers: Signed digits as an int64 array, modified in place
+    :param radices: Radices of each digit position
+    """
+
+    for i in range(len(numbers) - 1):
+        r = numbers[i]
+        factor = radices[i]
+        if r < 0 or r >= factor:
+            numbers[i] = r % factor
+            numbers[i + 1] += 1 if r > 0 else -1
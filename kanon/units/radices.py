@@ -49,8 +49,9 @@ from astropy.units.quantity_helper.helpers import _d
 
 from kanon.utils import Sign
 from kanon.utils.list_to_tuple import list_to_tuple
-from kanon.utils.looping_list import LoopingSList
+from kanon.utils.looping_list import LoopingList, LoopingSList
 
+from ._kernels import carry_loop, from_float_loop
 from .precision import PreciseNumber, PrecisionMode, TruncatureMode, set_precision
 
 __all__ = ["BasedReal"]
@@ -62,7 +63,11 @@ RadixBase = Tuple[LoopingSList[int], LoopingSList[int]]
 
 _NORMAL_BASES: Dict[LoopingSList[int], Type["BasedReal"]] = {}
 
+_INTERNED: Dict[Tuple, "BasedReal"] = {}
+_INTERNED_MAXSIZE = 8192
 
+
+@lru_cache(maxsize=256)
 def ndigit_for_radix(radix: int) -> int:
     """
     Compute how many digits are needed to represent a position of
@@ -76,7 +81,50 @@ def ndigit_for_radix(radix: int) -> int:
     :param radix:
     :return:
     """
-    return int(np.ceil(np.log10(radix)))
+    return len(str(radix - 1)) if radix > 1 else 1
+
+
+@lru_cache
+def _fractional_radices(radices: LoopingSList[int], significant: int) -> np.ndarray:
+    """
+    Radices of the `significant` first fractional positions of a base,
+    as a float64 array.
+
+    :param radices: Fractional part of a `RadixBase`
+    :param significant: Number of fractional positions
+    :return: Radices as a float64 array
+    """
+    return np.array([radices[i] for i in range(significant)], dtype="float64")
+
+
+@lru_cache
+def _fractional_factors(radices: LoopingSList[int], significant: int) -> np.ndarray:
+    """
+    Array of reciprocal place values for the `significant` first fractional
+    positions of a base, i.e. ``[1/r1, 1/(r1*r2), ...]``.
+
+    :param radices: Fractional part of a `RadixBase`
+    :param significant: Number of fractional positions
+    :return: Reciprocal place values as a float64 array
+    """
+    return 1 / np.cumprod([radices[i] for i in range(significant)], dtype="float64")
+
+
+@lru_cache
+def _position_radices(base: RadixBase, nleft: int, nright: int) -> np.ndarray:
+    """
+    Radices bounding each digit of a number with `nleft` integer positions
+    and `nright` fractional positions, as an int64 array.
+
+    :param base: Base
+    :param nleft: Number of integer positions
+    :param nright: Number of fractional positions
+    :return: Radices as an int64 array
+    """
+    return np.array(
+        [radix_at_pos(base, i - nleft + 1) for i in range(nleft + nright)],
+        dtype="int64",
+    )
 
 
 def radix_at_pos(base: RadixBase, pos: int):
@@ -100,6 +148,7 @@ def radix_at_pos(base: RadixBase, pos: int):
         return base[1][pos - 1]
 
 
+@lru_cache(maxsize=None)
 def factor_at_pos(base: RadixBase, pos: int):
     """
     Returns an int factor corresponding to a digit at position pos.
@@ -120,10 +169,11 @@ def factor_at_pos(base: RadixBase, pos: int):
     :rtype: int
     """
 
-    factor = 1
-    for i in range(abs(pos)):
-        factor *= radix_at_pos(base, i if pos > 0 else -i)
-    return factor
+    if pos == 0:
+        return 1
+    if pos > 0:
+        return factor_at_pos(base, pos - 1) * radix_at_pos(base, pos - 1)
+    return factor_at_pos(base, pos + 1) * radix_at_pos(base, pos + 1)
 
 
 class BasedReal(PreciseNumber, _Real):
@@ -135,6 +185,10 @@ class BasedReal(PreciseNumber, _Real):
     """Base of this BasedReal, (integer part, fractional part)"""
     _integer_separators: LoopingSList[str]
     """List of string separators, used for displaying the integer part of the number"""
+    _left_fmt: LoopingList[str]
+    """Zero-padding format of each integer position, used for display"""
+    _right_fmt: LoopingList[str]
+    """Zero-padding format of each fractional position, used for display"""
     __mixed: bool
     """Is the base used mixed"""
     __normal_base: Optional[Type["BasedReal"]] = None
@@ -172,6 +226,8 @@ class BasedReal(PreciseNumber, _Real):
             cls._integer_separators = LoopingSList(
                 ["," if x != 10 else "" for x in left]
             )
+        cls._left_fmt = LoopingList([f"%0{ndigit_for_radix(x)}d" for x in left])
+        cls._right_fmt = LoopingList([f"%0{ndigit_for_radix(x)}d" for x in right])
         right_loop = cls._base[1]
         cls.__mixed = any(x != cls._base[0][0] for x in cls._base[0] + right_loop)
         if cls.__mixed:
@@ -203,16 +259,26 @@ class BasedReal(PreciseNumber, _Real):
                     f"Illegal remainder value ({self.remainder}),\
                          should be a Decimal between [0.,1.["
                 )
-        for x in self[:]:
-            if isinstance(x, float):
-                raise IllegalFloatError(x)
-            if not isinstance(x, int):
-                raise TypeError(f"{x} not an int")
-        for i, s in enumerate(self[:]):
-            if s < 0.0 or s >= radix_at_pos(self.base, i - len(self.left) + 1):
-                raise IllegalBaseValueError(
-                    self.__class__, radix_at_pos(self.base, i - len(self.left) + 1), s
-                )
+        digits = self.left + self.right
+        arr = np.asarray(digits)
+        # An integer dtype is not enough: numpy scalars must not leak
+        # into left/right, they would break int() and hash() later on.
+        if arr.dtype.kind not in "iu" or not all(type(x) is int for x in digits):
+            for x in digits:
+                if isinstance(x, float):
+                    raise IllegalFloatError(x)
+                if not isinstance(x, int):
+                    raise TypeError(f"{x} not an int")
+        bad = (arr < 0) | (
+            arr >= _position_radices(self.base, len(self.left), len(self.right))
+        )
+        if bad.any():
+            i = int(np.argmax(bad))
+            raise IllegalBaseValueError(
+                self.__class__,
+                radix_at_pos(self.base, i - len(self.left) + 1),
+                digits[i],
+            )
 
     def __simplify_integer_part(self) -> int:
         """
@@ -270,11 +336,9 @@ class BasedReal(PreciseNumber, _Real):
         """
         if cls is BasedReal:
             raise TypeError("Can't instanciate abstract class BasedReal")
-        self: TBasedReal = super().__new__(cls)
-        self.__left = ()
-        self.__right = ()
-        self.__remainder = remainder
-        self.__sign = sign
+        if len(args) == 2 and type(args[0]) is tuple and type(args[1]) is tuple:
+            # Hot path: every arithmetic result is built from two tuples
+            return cls._interned(args[0], args[1], remainder, sign)
         if all(isinstance(x, int) for x in args):
             return cls.__new__(cls, args, (), remainder=remainder, sign=sign)
         if len(args) == 2:
@@ -285,8 +349,7 @@ class BasedReal(PreciseNumber, _Real):
                     return cls.__new__(cls, args[0]).resize(args[1])
                 return cls.from_decimal(args[0].decimal, args[1])
             if isinstance(args[0], tuple) and isinstance(args[1], tuple):
-                self.__left = args[0]
-                self.__right = args[1]
+                return cls._interned(args[0], args[1], remainder, sign)
             else:
                 raise ValueError("Incorrect parameters for BasedReal")
         elif len(args) == 1:
@@ -307,20 +370,56 @@ class BasedReal(PreciseNumber, _Real):
                 if isinstance(args[0], BasedReal)
                 else "Incorrect parameters at BasedReal creation"
             )
-        else:
-            raise ValueError("Incorrect number of parameter at BasedReal creation")
+        raise ValueError("Incorrect number of parameter at BasedReal creation")
+
+    @classmethod
+    def _interned(
+        cls: Type[TBasedReal],
+        left: Tuple[int, ...],
+        right: Tuple[int, ...],
+        remainder: Decimal,
+        sign: int,
+    ) -> TBasedReal:
+        """
+        Allocates and validates an instance from its canonical form,
+        returning the cached instance when one already exists.
+        """
+        # Key lookups use value equality (0 == 0.0 == Decimal(0)), so only
+        # exactly-typed arguments may hit or populate the cache; anything
+        # else must go through __check_range below.
+        trusted = (
+            type(remainder) is Decimal
+            and type(sign) is int
+            and sign in (-1, 1)
+            and all(type(x) is int for x in left)
+            and all(type(x) is int for x in right)
+        )
+        key = (cls, left, right, remainder, sign)
+        if trusted:
+            cached = _INTERNED.get(key)
+            if cached is not None:
+                return cached
+
+        self: TBasedReal = super().__new__(cls)
+        self.__left = left
+        self.__right = right
+        self.__remainder = remainder
+        self.__sign = sign
 
         self.__check_range()
 
         if self.__simplify_integer_part() or not self.left:
-            return cls.__new__(
-                cls,
-                self.left or (0,),
-                self.right,
-                remainder=self.remainder,
-                sign=self.sign,
+            return cls._interned(
+                self.left or (0,), self.right, self.remainder, self.sign
             )
 
+        if not trusted:
+            return self
+
+        if len(_INTERNED) >= _INTERNED_MAXSIZE:
+            del _INTERNED[next(iter(_INTERNED))]
+        _INTERNED[key] = self
+
         return self
 
     @property
@@ -414,9 +513,11 @@ class BasedReal(PreciseNumber, _Real):
         """
         value = Decimal(abs(int(self)))
         factor = Decimal(1)
+        right = self.right
+        br = self.base[1]
         for i in range(self.significant):
-            factor *= self.base[1][i]
-            value += self.right[i] / factor
+            factor *= br[i]
+            value += right[i] / factor
 
         value += self.remainder / factor
         return value * self.sign
@@ -455,31 +556,23 @@ class BasedReal(PreciseNumber, _Real):
 
         :return: String representation of this number
         """
-        res = ""
-        if self.sign < 0:
-            res += "-"
+        parts = ["-"] if self.sign < 0 else []
 
         for i in range(len(self.left)):
             if i > 0:
-                res += self._integer_separators[i - len(self.left)]
-            num = str(self.left[i])
-            digit = ndigit_for_radix(self.base[0][i - len(self.left)])
-            res += "0" * (digit - len(num)) + num
-
-        res += " ; "
+                parts.append(self._integer_separators[i - len(self.left)])
+            parts.append(self._left_fmt[i - len(self.left)] % self.left[i])
 
-        for i in range(len(self.right)):
-            num = str(self.right[i])
-            digit = ndigit_for_radix(self.base[1][i])
-            res += "0" * (digit - len(num)) + num
+        parts.append(" ; ")
 
-            if i < len(self.right) - 1:
-                res += ","
+        parts.append(
+            ",".join(self._right_fmt[i] % self.right[i] for i in range(len(self.right)))
+        )
 
         if self.remainder:
-            res += f" |r{self.remainder:3.1f}"
+            parts.append(f" |r{self.remainder:3.1f}")
 
-        return res
+        return "".join(parts)
 
     __str__ = __repr__
 
@@ -528,7 +621,11 @@ class BasedReal(PreciseNumber, _Real):
         if len(right) > 0:
             right_numbers = [int(i) for i in right.split(",")]
 
-        if len(left) > 0:
+        if len(left) > 0 and all(
+            sep.strip().lower() == "," for sep in cls._integer_separators
+        ):
+            left_numbers = [int(i) for i in left.split(",")]
+        elif len(left) > 0:
             rleft = left[::-1]
             for i in range(len(left)):
                 if len(rleft.strip()) == 1:
@@ -572,13 +669,18 @@ class BasedReal(PreciseNumber, _Real):
         if significant == self.significant:
             return self
         if significant > self.significant:
-            rem = type(self).from_decimal(
-                self.sign * self.remainder, significant - self.significant
-            )
+            value = self.remainder
+            extra = [0] * (significant - self.significant)
+            br = self.base[1]
+            for i in range(len(extra)):
+                value *= br[self.significant + i]
+                position_value = int(value)
+                value -= position_value
+                extra[i] = position_value
             return type(self)(
                 self.left,
-                self.right + rem.right,
-                remainder=rem.remainder,
+                self.right + tuple(extra),
+                remainder=value,
                 sign=self.sign,
             )
         if significant >= 0:
@@ -781,6 +883,15 @@ class BasedReal(PreciseNumber, _Real):
         :param key: desired index
         :return: value at the specified position
         """
+        if type(key) is int:
+            left = self.__left
+            if -len(left) < key <= 0:
+                return left[key - 1]
+            right = self.__right
+            if 0 < key <= len(right):
+                return right[key - 1]
+            raise IndexError
+
         if isinstance(key, slice):
             array = self.left + self.right
             start = key.start + len(self.left) - 1 if key.start is not None else None
@@ -820,26 +931,16 @@ class BasedReal(PreciseNumber, _Real):
         integer_part = cls.from_int(int(floa), significant=significant)
         value = abs(floa - int(integer_part))
 
-        right = [0] * significant
-
-        factor = 1.0
-        if value != 0:
-            for i in range(significant):
-                factor = cls._base[1][i]
-                value *= factor
-                if value - int(value) > remainder_threshold and value + 1 < factor:
-                    value = int(value) + 1
-                elif value - int(value) < 1 - remainder_threshold and any(
-                    x != 0 for x in right
-                ):
-                    value = int(value)
-                position_value = int(value)
-                value -= position_value
-                right[i] = position_value
+        right, value = from_float_loop(
+            float(value),
+            _fractional_radices(cls._base[1], significant),
+            significant,
+            remainder_threshold,
+        )
 
         return cls(
             integer_part.left,
-            tuple(right),
+            tuple(right.tolist()),
             remainder=Decimal(value),
             sign=-1 if floa < 0 else 1,
         )
@@ -867,9 +968,9 @@ class BasedReal(PreciseNumber, _Real):
 
         right = [0] * significant
 
+        br = cls._base[1]
         for i in range(significant):
-            factor = cls._base[1][i]
-            value *= factor
+            value *= br[i]
             position_value = int(value)
             value -= position_value
             right[i] = position_value
@@ -959,8 +1060,7 @@ class BasedReal(PreciseNumber, _Real):
 
         for i in range(pos):
             int_factor //= base[0][-pos + i]
-            position_value = value // int_factor
-            value -= position_value * int_factor
+            position_value, value = divmod(value, int_factor)
             left[i] = position_value
 
         return cls(left, (0,) * significant, sign=sign)
@@ -978,9 +1078,10 @@ class BasedReal(PreciseNumber, _Real):
         """
         value = float(abs(int(self)))
         factor = 1.0
-        for i in range(self.significant):
-            factor /= self.base[1][i]
-            value += factor * self.right[i]
+        if self.significant:
+            factors = _fractional_factors(self.base[1], self.significant)
+            value += np.dot(np.asarray(self.right, dtype="float64"), factors)
+            factor = factors[-1]
 
         value += factor * float(self.remainder)
         return float(value * self.sign)
@@ -991,9 +1092,11 @@ class BasedReal(PreciseNumber, _Real):
         """
         value = 0
         factor = 1
-        for i in range(len(self.left)):
-            value += factor * self.left[-i - 1]
-            factor *= self.base[0][-i - 1]
+        left = self.left
+        bl = self.base[0]
+        for i in range(len(left)):
+            value += factor * left[-i - 1]
+            factor *= bl[-i - 1]
 
         return value * self.sign
 
@@ -1028,10 +1131,11 @@ class BasedReal(PreciseNumber, _Real):
 
         q_res += q
 
+        br = self.base[1]
         for i in range(0, max_significant):
-            numerator = r * self.base[1][i]
+            numerator = r * br[i]
             q, r = divmod(numerator, denominator)
-            if q == self.base[1][i]:  # pragma: no cover
+            if q == br[i]:  # pragma: no cover
                 q_res += 1
                 r = self.zero()
                 break
@@ -1052,14 +1156,19 @@ class BasedReal(PreciseNumber, _Real):
         va = self.resize(maxright)
         vb = other.resize(maxright)
 
-        sign = va.sign if abs(cast(BasedReal, va)) > abs(vb) else vb.sign
+        pad_a = (0,) * (maxleft - len(va.left)) + va.left
+        pad_b = (0,) * (maxleft - len(vb.left)) + vb.left
+        sign = (
+            va.sign
+            if (pad_a, va.right, va.remainder) > (pad_b, vb.right, vb.remainder)
+            else vb.sign
+        )
         if sign < 0:
             va = -va
             vb = -vb
 
-        maxlen = max(len(va[:]), len(vb[:]))
         values = (
-            [v.sign * x for x in v[::-1]] + [0] * (maxlen - len(v[:]))
+            [v.sign * x for x in v[::-1]] + [0] * (maxleft - len(v.left))
             for v in (cast(BasedReal, va), vb)
         )
         numbers: List[int] = [a + b for a, b in zip(*values)] + [0]
@@ -1069,13 +1178,12 @@ class BasedReal(PreciseNumber, _Real):
         remainder -= int(fn)
         numbers[0] += int(fn)
 
-        for i, r in enumerate(numbers):
-            factor = radix_at_pos(self.base, maxright - i)
-            if r < 0 or r >= factor:
-                numbers[i] = r % factor
-                numbers[i + 1] += 1 if r > 0 else -1
+        arr = np.array(numbers, dtype="int64")
+        carry_loop(
+            arr, _position_radices(self.base, len(numbers) - maxright, maxright)[::-1]
+        )
 
-        numbers = [abs(x) for x in numbers[::-1]]
+        numbers = [abs(x) for x in arr.tolist()[::-1]]
         left = numbers[: maxleft + 1]
         right = numbers[maxleft + 1 :]
 
@@ -1337,6 +1445,8 @@ class BasedReal(PreciseNumber, _Real):
 
     def __gt__(self: TBasedReal, other) -> bool:
         """self > other"""
+        if self is other:
+            return False
         if not isinstance(other, Number):
             return other <= self
         if isinstance(other, BasedReal):
@@ -1346,6 +1456,8 @@ class BasedReal(PreciseNumber, _Real):
 
     def __eq__(self: TBasedReal, other) -> bool:
         """self == other"""
+        if self is other:
+            return True
         if not isinstance(other, SupportsFloat):
             return False
         if isinstance(other, BasedReal):
@@ -1382,7 +1494,14 @@ class BasedReal(PreciseNumber, _Real):
 
     def __ge__(self: TBasedReal, other) -> bool:
         """self >= other"""
-        return self > other or self == other
+        if self is other:
+            return True
+        if not isinstance(other, Number):
+            return other <= self
+        if isinstance(other, BasedReal):
+            return self.decimal >= other.decimal
+        other = cast(SupportsFloat, other)
+        return float(self) >= float(other)
 
     def __lt__(self: TBasedReal, other) -> bool:
         """self < other"""
@@ -1394,17 +1513,35 @@ class BasedReal(PreciseNumber, _Real):
 
     def __floor__(self):
         """Finds the greatest Integral <= self."""
-        return self.__trunc__() + (1 if self.sign < 0 else 0)
+        truncated = self.__trunc__()
+        if self.sign < 0 and (self.remainder or any(self.right)):
+            return truncated - 1
+        return truncated
 
     def __ceil__(self):
         """Finds the least Integral >= self."""
-        return self.__trunc__() + (1 if self.sign > 0 else 0)
+        truncated = self.__trunc__()
+        if self.sign > 0 and (self.remainder or any(self.right)):
+            return truncated + 1
+        return truncated
 
     def __hash__(self) -> int:
-        if self.remainder == 0 and all([x == 0 for x in self.right]):
+        if self.remainder == 0 and all(x == 0 for x in self.right):
             return int(self)
         return hash((self.left, self.right, self.sign, self.remainder))
 
+    def __copy__(self: TBasedReal) -> TBasedReal:
+        return self
+
+    def __deepcopy__(self: TBasedReal, memo) -> TBasedReal:
+        return self
+
+    def __getnewargs_ex__(self):
+        return (
+            (self.left, self.right),
+            {"remainder": self.remainder, "sign": self.sign},
+        )
+
     def sqrt(self: TBasedReal, iteration: Optional[int] = None) -> TBasedReal:
         """Returns the square root, using Babylonian method
 
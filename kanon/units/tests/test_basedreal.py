@@ -89,6 +89,8 @@ def test_init():
     with pytest.raises(IllegalFloatError) as err:
         Sexagesimal((0.3, 5), (6, 8))
     assert "An illegal float" in str(err.value)
+    with pytest.raises(TypeError):
+        Sexagesimal((np.int64(1), 5), (6, 8))
 
     # From BasedReal
 
@@ -147,8 +149,12 @@ def test_truncations():
     assert m.trunc(s) == 3750
     assert m.floor(s) == 3750
     assert m.ceil(s) == 3751
-    assert m.floor(-s) == -3749
+    assert m.floor(-s) == -3751
     assert m.ceil(-s) == -3750
+    assert m.floor(Sexagesimal(2)) == 2
+    assert m.ceil(Sexagesimal(2)) == 2
+    assert m.floor(-Sexagesimal(2)) == -2
+    assert m.ceil(-Sexagesimal(2)) == -2
     assert Sexagesimal(1, 2, 3).minimize_precision().equals(Sexagesimal(1, 2, 3))
     assert (
         Sexagesimal("1, 2, 3; 0, 0").minimize_precision().equals(Sexagesimal(1, 2, 3))
@@ -209,6 +215,17 @@ def test_resize(x, y):
     assert resized.significant == y
 
 
+def test_resize_mixed_base():
+    class MNumber(BasedReal, base=([5, 2], [3, 4])):
+        pass
+
+    n = MNumber((1,), (1, 2, 1, 3))
+    shrunk = n.resize(2)
+    assert shrunk.equals(MNumber((1,), (1, 2), remainder=Decimal(7) / 16))
+    assert shrunk.resize(4).equals(n)
+    assert MNumber("1;1,2").resize(4).equals(MNumber((1,), (1, 2, 0, 0)))
+
+
 @given(st.floats(allow_infinity=False, allow_nan=False))
 def test_comparisons(x):
     s = Sexagesimal("1, 2; 30")